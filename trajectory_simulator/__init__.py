@@ -3,6 +3,9 @@ from .config.config import Config
 
 # GPS 相关
 from .gps.gps_device import GPSDevice
+from .gps.gps_device import (POSITION_KEY, ALTITUDE_KEY, TIMESTAMP_KEY,
+                             HEADING_KEY, ACCURACY_KEY, SIGNAL_STRENGTH_KEY,
+                             WGS84_POSITION_KEY)
 from .gps.advanced_gps_device import AdvancedGPSDevice
 from .gps.gps_device_factory import GPSDeviceFactory
 from .gps.gps_observer import GPSObserver
@@ -14,11 +17,11 @@ from .person.person import Person, PersonFactory, PersonObserver, MovementStrate
 # 观察者
 from .observers.trajectory_observer import TrajectoryObserver
 from .observers.console_trajectory_observer import ConsoleTrajectoryObserver
+from .observers.file_trajectory_observer import FileTrajectoryObserver
 from .observers.gpx_trajectory_observer import GPXTrajectoryObserver
 
 # 地形和高程
 from .terrain.elevation_provider import ElevationProvider
-from .terrain.arcgis_elevation_provider import ArcgisElevationProvider
 
 # 主模拟器
 from .trajectory_simulator import TrajectorySimulator
@@ -28,3 +31,16 @@ from .inspection_task import InspectionTask
 
 # 版本信息
 __version__ = "1.0.2"
+
+
+def __getattr__(name):
+    """
+    按需导入依赖arcpy的模块（PEP 562）
+
+    import arcpy 的冷启动动辄数秒，默认高程提供者的用户不该为它买单，
+    因此只有真正访问 ArcgisElevationProvider 时才导入。
+    """
+    if name == "ArcgisElevationProvider":
+        from .terrain.arcgis_elevation_provider import ArcgisElevationProvider
+        return ArcgisElevationProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
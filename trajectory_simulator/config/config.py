@@ -1,21 +1,25 @@
 import json
 import os
-from typing import Dict, Any, Union, List, Tuple
+from typing import Dict, Any, Union, Tuple
 import time
+import numpy as np
 from ..terrain.elevation_provider import ElevationProvider
 
+# 按提供者类型与参数缓存实例：ArcgisElevationProvider 构造时会逐个打开DEM，
+# 代价很高，同配置下全进程只应打开一次
+_elevation_provider_cache: Dict[Tuple, ElevationProvider] = {}
+
 class Config:
     """
     配置类，使用单例模式确保全局只有一个配置实例。
     可以从 JSON 文件或 JSON 字符串加载配置。
     """
 
-    _instance = None
-
     # 模拟相关配置
     TOLERANCE_KEY = "simulation.tolerance"
     CLOSING_DISTANCE_KEY = "simulation.closing_distance" # 最后一条边距离终点的距离容差
     TIME_STEP_KEY = "simulation.time_step"  # 新增
+    SIMULATION_SEED_KEY = "simulation.seed"  # 随机种子，缺省时不固定
 
     # GPS设备相关配置
     GPS_DEVICE_TYPE_KEY = "gps.device_type"
@@ -55,12 +59,12 @@ class Config:
 
     def __new__(cls):
         """
-        实现单例模式，确保只有一个 Config 实例。
+        实现单例模式：直接返回模块导入时创建的唯一实例。
+
+        实例在模块底部预先创建好，这里不再需要判空分支，
+        也避免了延迟初始化的线程安全问题。
         """
-        if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-            cls._instance._config = {}
-        return cls._instance
+        return _instance
 
     def load(self, source: Union[str, None] = None):
         """
@@ -88,6 +92,7 @@ class Config:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 self._config.update(json.load(f))
+            self._rebuild_flat()
             print(f"配置已从文件 {file_path} 加载")
         except FileNotFoundError:
             print(f"错误: 找不到文件 {file_path}")
@@ -102,9 +107,28 @@ class Config:
         """
         try:
             self._config.update(json.loads(json_string))
+            self._rebuild_flat()
         except json.JSONDecodeError:
             print("错误: 提供的字符串不是有效的 JSON")
 
+    def _rebuild_flat(self):
+        """
+        把嵌套配置展平为“点分键 -> 值”的索引。
+
+        get 因此只需一次字典查找，省去每次调用的键拆分和逐层遍历；
+        中间节点（子字典）也会入索引，保持按前缀取子配置的用法可用。
+        """
+        self._flat = {}
+
+        def walk(prefix, node):
+            for k, v in node.items():
+                flat_key = prefix + k
+                self._flat[flat_key] = v
+                if isinstance(v, dict):
+                    walk(flat_key + '.', v)
+
+        walk('', self._config)
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         获取配置值。如果键不存在，则返回默认值。
@@ -127,13 +151,7 @@ class Config:
         :param default: 默认值
         :return: 配置值或默认值
         """
-        keys = key.split('.')
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        value = self._flat.get(key)
         return value if value is not None else default
 
     def set(self, key: str, value: Any):
@@ -148,6 +166,7 @@ class Config:
         for k in keys[:-1]:
             config = config.setdefault(k, {})
         config[keys[-1]] = value
+        self._rebuild_flat()
 
     def __getitem__(self, key: str) -> Any:
         """
@@ -202,21 +221,37 @@ class Config:
         provider_type = self.get(self.ELEVATION_PROVIDER_KEY, "default")
         provider_params = self.get(self.ELEVATION_PROVIDER_PARAMS_KEY, {})
 
+        if provider_type == "arcgis":
+            cache_key = ("arcgis", tuple(provider_params.get("dem_path_list", [])))
+        else:
+            cache_key = ("default",)
+        provider = _elevation_provider_cache.get(cache_key)
+        if provider is not None:
+            return provider
+
         if provider_type == "arcgis":
             from ..terrain.arcgis_elevation_provider import ArcgisElevationProvider
-            return ArcgisElevationProvider(provider_params.get("dem_path_list", []))
+            provider = ArcgisElevationProvider(provider_params.get("dem_path_list", []))
         else:
             # 默认使用一个简单的高程提供者，总是返回0米高程
             class DefaultElevationProvider(ElevationProvider):
                 def get_elevation(self, lon: float, lat: float) -> float:
                     return 0.0
-                def batch_get_elevation(self, lon_lat_list: List[Tuple[float, float]]) -> List[float]:
-                    return [0.0] * len(lon_lat_list)
-            return DefaultElevationProvider()
+                def batch_get_elevation(self, lons, lats):
+                    return np.zeros(len(lons))
+            provider = DefaultElevationProvider()
+        _elevation_provider_cache[cache_key] = provider
+        return provider
 
     def get_coordinate_system(self):
         return self.get(self.GPS_COORDINATE_SYSTEM_KEY, "EPSG:4510")
 
     def get_time_unit(self):
         """获取时间单位，默认为秒"""
-        return self.get(self.GPS_TIME_UNIT_KEY, "second")
\ No newline at end of file
+        return self.get(self.GPS_TIME_UNIT_KEY, "second")
+
+# 模块导入时即创建单例实例（天然线程安全，__new__ 无需判空）
+_instance = object.__new__(Config)
+_instance._config = {}
+_instance._flat = {}
+Config._instance = _instance
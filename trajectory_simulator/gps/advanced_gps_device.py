@@ -1,13 +1,73 @@
-from .gps_device import GPSDevice, POSITION_KEY, ALTITUDE_KEY, TIMESTAMP_KEY, HEADING_KEY, ACCURACY_KEY, SIGNAL_STRENGTH_KEY, WGS84_POSITION_KEY
+from .gps_device import GPSDevice, GPSData
 from ..config.config import Config
-import random
-import math
-from typing import Dict
-from shapely.geometry import Point
+import numpy as np
+from functools import lru_cache
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _tick_kernel(signal_strength, min_accuracy, max_accuracy, min_signal_strength,
+                 improvement_threshold, r_signal, r_accuracy, jitter_x, jitter_y):
+    """
+    每tick的信号强度、精度与定位误差的标量计算核心
+
+    纯浮点运算，不触碰任何Python对象，便于numba编译为直线机器码。
+
+    :param signal_strength: 更新前的信号强度
+    :param min_accuracy: 最小精度值
+    :param max_accuracy: 最大精度值
+    :param min_signal_strength: 最小信号强度
+    :param improvement_threshold: 信号强度显著提高的阈值
+    :param r_signal: 信号强度扰动用的[0,1)均匀随机数
+    :param r_accuracy: 精度扰动用的[0,1)均匀随机数
+    :param jitter_x: 单位圆内误差偏移X分量
+    :param jitter_y: 单位圆内误差偏移Y分量
+    :return: (新信号强度, 新精度, 误差偏移X, 误差偏移Y)
+    """
+    # 信号强度变化范围为 -0.05 到 0.05
+    new_strength = signal_strength + (r_signal - 0.5) * 0.1
+    if new_strength < min_signal_strength:
+        new_strength = min_signal_strength
+    elif new_strength > 1.0:
+        new_strength = 1.0
+
+    # 精度与信号强度成反比，并叠加 -0.5 到 0.5 的随机波动
+    accuracy = max_accuracy - new_strength * (max_accuracy - min_accuracy)
+    accuracy += r_accuracy - 0.5
+    if accuracy < min_accuracy:
+        accuracy = min_accuracy
+    elif accuracy > max_accuracy:
+        accuracy = max_accuracy
+
+    # 信号强度显著提高时模拟位置跳变到更精确的位置，否则保持小幅抖动
+    if new_strength - signal_strength > improvement_threshold:
+        error_scale = accuracy
+    else:
+        error_scale = accuracy / 10
+
+    return (new_strength, accuracy, jitter_x * error_scale, jitter_y * error_scale)
+
+
+if njit is not None:
+    _tick_kernel = njit('UniTuple(f8, 4)(f8, f8, f8, f8, f8, f8, f8, f8, f8)',
+                        cache=True, fastmath=True)(_tick_kernel)
+
 
 class AdvancedGPSDevice(GPSDevice):
     """高级GPS设备实现，包含复杂的模拟逻辑"""
 
+    # 每批预生成的定位误差偏移个数
+    JITTER_BLOCK_SIZE = 256
+
+    # 每批预生成的[0,1)均匀随机数个数
+    RANDOM_BLOCK_SIZE = 1024
+
+    # 信号强度显著提高的阈值
+    SIGNAL_IMPROVEMENT_THRESHOLD = 0.2
+
     def __init__(self, config: Config):
         """
         初始化高级GPS设备
@@ -16,106 +76,122 @@ class AdvancedGPSDevice(GPSDevice):
         """
         super().__init__(config)
         self.accuracy = config.get(Config.GPS_INITIAL_ACCURACY_KEY)
+        self.min_accuracy = config.get(Config.GPS_MIN_ACCURACY_KEY, 2.5)
+        self.max_accuracy = config.get(Config.GPS_MAX_ACCURACY_KEY, 12.0)
+        self.min_signal_strength = config.get(Config.GPS_MIN_SIGNAL_STRENGTH_KEY, 0.4)
         
         # 初始化信号强度
         min_strength = config.get(Config.GPS_INITIAL_SIGNAL_STRENGTH_MIN_KEY, 0.8)
         max_strength = config.get(Config.GPS_INITIAL_SIGNAL_STRENGTH_MAX_KEY, 1.0)
 
+        # 按约1米的网格缓存高程查询：抖动范围内的位置命中同一网格，
+        # 避免每次采样都访问高程提供者
+        self._elevation_cell_cache = lru_cache(maxsize=4096)(self._lookup_elevation_cell)
+
+        # 成批预生成单位圆内的误差偏移与均匀随机数，每tick只需取用
+        self._np_rng = np.random.default_rng()
+        self._refill_jitter()
+        self._rand_buf = self._np_rng.random(self.RANDOM_BLOCK_SIZE)
+        self._rand_index = 0
+
         lon, lat = self.get_position_wgs84()
-        self.altitude = self.elevation_provider.get_elevation(lon, lat)
-        self.__signal_strength = random.uniform(min_strength, max_strength)
+        self.altitude = self._get_elevation(lon, lat)
+        self.__signal_strength = min_strength + (max_strength - min_strength) * self._next_random()
 
-    def update(self, elapsed_time: float, offset: Point) -> None:
+    def update(self, elapsed_time: float, offset_x: float, offset_y: float) -> None:
         """
         更新高级GPS设备状态，包括精度变化、信号强度变化和位置更新
         
         :param elapsed_time: 经过的时间（以配置的时间单位为准）
-        :param offset: 相对当前位置的偏移
+        :param offset_x: 相对当前位置的X方向偏移
+        :param offset_y: 相对当前位置的Y方向偏移
         """
         # 将elapsed_time转换为秒
         elapsed_time_seconds = elapsed_time * self.time_unit_factor
         self.current_time += elapsed_time_seconds
-        # 更新真实位置
-        self.set_position(Point(self.position.x + offset.x, self.position.y + offset.y))
-        
-        # 模拟信号强度变化
-        old_signal_strength = self.__signal_strength
-        self._update_signal_strength()
-        
-        # 模拟精度变化
-        self._update_accuracy()
-        
-        # 更新GPS位置
-        self._update_position(old_signal_strength)
 
-        self.altitude = self.elevation_provider.get_elevation(self.wgs84_position.x, self.wgs84_position.y)
+        # 信号强度、精度与定位误差在一个编译后的标量核心中一次算完
+        if self._jitter_index >= self.JITTER_BLOCK_SIZE:
+            self._refill_jitter()
+        index = self._jitter_index
+        self._jitter_index = index + 1
+        self.__signal_strength, self.accuracy, error_x, error_y = _tick_kernel(
+            self.__signal_strength,
+            self.min_accuracy, self.max_accuracy, self.min_signal_strength,
+            self.SIGNAL_IMPROVEMENT_THRESHOLD,
+            self._next_random(), self._next_random(),
+            self._jitter_x[index], self._jitter_y[index])
+
+        # 误差偏移与真实位移合并后只做一次坐标更新
+        self.set_position_xy(self.position_x + offset_x + error_x,
+                             self.position_y + offset_y + error_y)
+
         if self.should_sample():
+            # 只在实际采样时查询高程，避免每个tick都向提供者发起请求
+            self.altitude = self._get_elevation(self.wgs84_x, self.wgs84_y)
             self.record_data()
-            self.last_sampled_position = self.position
-            self.notify_observers(self.get_data())
+            self.last_sampled_x = self.position_x
+            self.last_sampled_y = self.position_y
+            # 没有观察者处理更新时完全跳过数据快照的构造
+            if self._batch_callbacks:
+                self.notify_observers(self.get_data())
 
-    def _update_position(self, old_signal_strength: float):
+    def _lookup_elevation_cell(self, cell):
         """
-        更新GPS位置
-        当信号强度显著提高时，模拟位置跳变到更精确的位置
-        
-        :param old_signal_strength: 更新前的信号强度
+        查询一个网格单元中心的高程（供LRU缓存包装）
+
+        :param cell: 量化后的(经度, 纬度)网格键
+        :return: 高程值（米）
         """
-        # 定义信号强度显著提高的阈值
-        SIGNAL_IMPROVEMENT_THRESHOLD = 0.2
-        
-        if self.__signal_strength - old_signal_strength > SIGNAL_IMPROVEMENT_THRESHOLD:
-            # 信号强度显著提高，更新到更精确的位置
-            error_distance = random.uniform(0, self.accuracy)
-            error_angle = random.uniform(0, 2 * math.pi)
-            error_x = error_distance * math.cos(error_angle)
-            error_y = error_distance * math.sin(error_angle)
-            self.set_position(Point(self.position.x + error_x, self.position.y + error_y))
-        else:
-            # 信号强度变化不大，保持小幅度抖动
-            jitter_distance = random.uniform(0, self.accuracy / 10)
-            jitter_angle = random.uniform(0, 2 * math.pi)
-            jitter_x = jitter_distance * math.cos(jitter_angle)
-            jitter_y = jitter_distance * math.sin(jitter_angle)
-            self.set_position(Point(self.position.x + jitter_x, self.position.y + jitter_y))
-
-    def _update_accuracy(self):
+        return self.elevation_provider.get_elevation(cell[0] * 1e-5, cell[1] * 1e-5)
+
+    def _get_elevation(self, lon: float, lat: float) -> float:
         """
-        模拟GPS精度变化
-        精度与信号强度成反比：
-        - 信号强度高 -> 精度值小 -> 定位更精确
-        - 信号强度低 -> 精度值大 -> 定位不精确
+        获取高程，按空间网格做缓存
+
+        :param lon: 经度
+        :param lat: 纬度
+        :return: 高程值（米）
         """
-        min_accuracy = self.config.get(Config.GPS_MIN_ACCURACY_KEY, 2.5)
-        max_accuracy = self.config.get(Config.GPS_MAX_ACCURACY_KEY, 12.0)
-        
-        # 计算精度：信号强度越高，精度值越接近最小值（最精确）
-        accuracy_range = max_accuracy - min_accuracy
-        self.accuracy = max_accuracy - (self.__signal_strength * accuracy_range)
-        
-        # 添加一些随机波动以模拟真实世界的不确定性
-        accuracy_variation = random.uniform(-0.5, 0.5)
-        self.accuracy = max(min_accuracy, min(max_accuracy, self.accuracy + accuracy_variation))
+        return self._elevation_cell_cache((round(lon * 1e5), round(lat * 1e5)))
+
+    def _next_random(self) -> float:
+        """
+        取下一个[0,1)均匀随机数
+
+        随机数整批由PCG64生成器预填充，逐次消费只剩数组取值，
+        省去stdlib random逐次方法调用的开销。
+
+        :return: [0,1)区间的随机数
+        """
+        if self._rand_index >= self.RANDOM_BLOCK_SIZE:
+            self._np_rng.random(out=self._rand_buf)
+            self._rand_index = 0
+        value = self._rand_buf[self._rand_index]
+        self._rand_index += 1
+        return value
+
+    def _refill_jitter(self):
+        """整批重新生成单位圆内均匀方向的误差偏移"""
+        magnitude = self._np_rng.random(self.JITTER_BLOCK_SIZE)
+        angle = self._np_rng.uniform(0, 2 * np.pi, self.JITTER_BLOCK_SIZE)
+        self._jitter_x = magnitude * np.cos(angle)
+        self._jitter_y = magnitude * np.sin(angle)
+        self._jitter_index = 0
 
-    def _update_signal_strength(self):
-        """模拟GPS信号强度变化"""
-        min_strength = self.config.get(Config.GPS_MIN_SIGNAL_STRENGTH_KEY, 0.4)
-        strength_change = random.uniform(-0.05, 0.05)  # 信号强度变化范围为 -0.05 到 0.05
-        self.__signal_strength = max(min_strength, min(1.0, self.__signal_strength + strength_change))
+    def _append_record(self) -> None:
+        """把当前状态按标量列写入轨迹（含精度与信号强度列）"""
+        self.trajectory.append(self.position_x, self.position_y,
+                               self.wgs84_x, self.wgs84_y,
+                               self.altitude, self.current_time, self.heading,
+                               self.accuracy, self.__signal_strength)
 
-    def get_data(self) -> Dict:
+    def get_data(self) -> GPSData:
         """
         获取高级GPS设备的当前数据
         
-        :return: GPS数据字典
+        :return: GPS数据快照
         """
-        data = {
-            POSITION_KEY: self.position,
-            ALTITUDE_KEY: self.altitude,
-            TIMESTAMP_KEY: self.current_time,
-            HEADING_KEY: self.heading,
-            ACCURACY_KEY: self.accuracy,
-            SIGNAL_STRENGTH_KEY: self.__signal_strength,
-            WGS84_POSITION_KEY: self.wgs84_position,
-        }
-        return data
\ No newline at end of file
+        return GPSData(self.position, self.altitude, self.current_time,
+                       self.heading, self.accuracy, self.__signal_strength,
+                       self.wgs84_position)
\ No newline at end of file
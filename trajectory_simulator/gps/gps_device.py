@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Dict, Tuple
+import numpy as np
 from shapely.geometry import Point
 from ..config.config import Config
 from .gps_observer import GPSObserver
 from .sampling_strategy import SamplingStrategy, SamplingStrategyFactory
-from pyproj import CRS, Transformer
 
 # 定义常量
 POSITION_KEY = 'position' # 位置
@@ -15,9 +16,162 @@ ACCURACY_KEY = 'accuracy' # 精度
 SIGNAL_STRENGTH_KEY = 'signal_strength' # 信号强度
 WGS84_POSITION_KEY = 'wgs84_position' # WGS84坐标系下的位置
 
+# 时间单位到秒的换算系数
+_TIME_UNIT_FACTORS = {
+    'millisecond': 0.001,
+    'second': 1,
+    'minute': 60,
+    'hour': 3600,
+}
+
+class GPSData:
+    """
+    单个采样点的GPS数据快照
+
+    槽式对象替代逐次分配的7键字典：无哈希表、字段访问是固定偏移，
+    长时间模拟下分配与GC开销都明显更低。支持 data[POSITION_KEY]
+    这样的字典式读取，既有观察者代码无需改动。
+    """
+
+    __slots__ = ('position', 'altitude', 'timestamp', 'heading',
+                 'accuracy', 'signal_strength', 'wgs84_position')
+
+    _KEY_TO_ATTR = {
+        POSITION_KEY: 'position',
+        ALTITUDE_KEY: 'altitude',
+        TIMESTAMP_KEY: 'timestamp',
+        HEADING_KEY: 'heading',
+        ACCURACY_KEY: 'accuracy',
+        SIGNAL_STRENGTH_KEY: 'signal_strength',
+        WGS84_POSITION_KEY: 'wgs84_position',
+    }
+
+    def __init__(self, position, altitude, timestamp, heading,
+                 accuracy, signal_strength, wgs84_position):
+        self.position = position
+        self.altitude = altitude
+        self.timestamp = timestamp
+        self.heading = heading
+        self.accuracy = accuracy
+        self.signal_strength = signal_strength
+        self.wgs84_position = wgs84_position
+
+    def __getitem__(self, key):
+        return getattr(self, self._KEY_TO_ATTR[key])
+
+    def __contains__(self, key):
+        return key in self._KEY_TO_ATTR
+
+
+@lru_cache(maxsize=32)
+def _get_crs(crs_string: str):
+    """按字符串缓存CRS对象，同一坐标系的设备不再重复解析"""
+    from pyproj import CRS
+    return CRS.from_string(crs_string)
+
+
+@lru_cache(maxsize=32)
+def _is_wgs84_crs(crs_string: str) -> bool:
+    """判断坐标系是否就是WGS84（结果按字符串缓存，CRS比较并不便宜）"""
+    from pyproj import CRS
+    return _get_crs(crs_string).equals(CRS.from_epsg(4326))
+
+
+@lru_cache(maxsize=32)
+def _get_to_wgs84_transformer(crs_string: str):
+    """
+    获取到WGS84的坐标转换函数（按源坐标系字符串缓存）
+
+    Transformer.from_crs 需要查询PROJ数据库，构造一次要上百毫秒；
+    同一坐标系的所有设备共享同一个Transformer实例。
+
+    :param crs_string: 源坐标系字符串（如 "EPSG:32650"）
+    :return: 转换函数 (x, y) -> (lon, lat)
+    """
+    from pyproj import CRS, Transformer
+    return Transformer.from_crs(CRS.from_string(crs_string), CRS.from_epsg(4326),
+                                always_xy=True).transform
+
+
+class Trajectory:
+    """
+    轨迹的列式（SoA）存储
+
+    每个采样点的各字段存入平行的numpy数组，而不是逐点分配字典，
+    长时间模拟下内存占用与GC压力都远小于字典列表；
+    需要字典视图时通过 to_records 按需构造。
+    """
+
+    INITIAL_CAPACITY = 256
+
+    def __init__(self):
+        self._size = 0
+        self._capacity = self.INITIAL_CAPACITY
+        self.xs = np.empty(self._capacity)
+        self.ys = np.empty(self._capacity)
+        self.wgs84_xs = np.empty(self._capacity)
+        self.wgs84_ys = np.empty(self._capacity)
+        self.altitudes = np.empty(self._capacity)
+        self.timestamps = np.empty(self._capacity)
+        self.headings = np.empty(self._capacity)
+        self.accuracies = np.empty(self._capacity)
+        self.signal_strengths = np.empty(self._capacity)
+
+    def _columns(self):
+        return (self.xs, self.ys, self.wgs84_xs, self.wgs84_ys, self.altitudes,
+                self.timestamps, self.headings, self.accuracies, self.signal_strengths)
+
+    def _grow(self):
+        """容量翻倍，摊还后append为O(1)"""
+        new_capacity = self._capacity * 2
+        for name, column in zip(('xs', 'ys', 'wgs84_xs', 'wgs84_ys', 'altitudes',
+                                 'timestamps', 'headings', 'accuracies', 'signal_strengths'),
+                                self._columns()):
+            new_column = np.empty(new_capacity)
+            new_column[:self._size] = column[:self._size]
+            setattr(self, name, new_column)
+        self._capacity = new_capacity
+
+    def append(self, x: float, y: float, wgs84_x: float, wgs84_y: float,
+               altitude: float, timestamp: float, heading: float,
+               accuracy: float, signal_strength: float) -> None:
+        """追加一个采样点（全部为标量，不产生任何中间对象）"""
+        if self._size >= self._capacity:
+            self._grow()
+        index = self._size
+        self.xs[index] = x
+        self.ys[index] = y
+        self.wgs84_xs[index] = wgs84_x
+        self.wgs84_ys[index] = wgs84_y
+        self.altitudes[index] = altitude
+        self.timestamps[index] = timestamp
+        self.headings[index] = heading
+        self.accuracies[index] = accuracy
+        self.signal_strengths[index] = signal_strength
+        self._size = index + 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def to_records(self) -> List[Dict]:
+        """构造字典列表视图（仅供对外接口，内部计算请直接用列数组）"""
+        return [{
+            POSITION_KEY: Point(self.xs[i], self.ys[i]),
+            ALTITUDE_KEY: self.altitudes[i],
+            TIMESTAMP_KEY: self.timestamps[i],
+            HEADING_KEY: self.headings[i],
+            ACCURACY_KEY: self.accuracies[i],
+            SIGNAL_STRENGTH_KEY: self.signal_strengths[i],
+            WGS84_POSITION_KEY: Point(self.wgs84_xs[i], self.wgs84_ys[i]),
+        } for i in range(self._size)]
+
+
 class GPSDevice(ABC):
     """GPS设备抽象基类"""
 
+    # 观察者通知的攒批大小：每凑满一批才做一轮虚方法分发
+    NOTIFY_BATCH_SIZE = 32
+
     def __init__(self, config: Config):
         """
         初始化GPS设备
@@ -26,67 +180,118 @@ class GPSDevice(ABC):
         """
         self.config = config
         self.elevation_provider = config.get_elevation_provider()
-        self.trajectory: List[Dict] = []
+        self.trajectory = Trajectory()
         self.is_recording = False
         self.is_paused = False
         self.current_time = 0 # 当前时间, 默认为0
-        self.position = Point(0, 0) # 当前位置，默认为0
-        self.wgs84_position = Point(0, 0) # WGS84坐标系下的位置
+        # 坐标以裸浮点数存储，Point对象只在对外接口处按需构造
+        self.position_x = 0.0 # 当前位置，默认为0
+        self.position_y = 0.0
+        self._wgs84_x = 0.0 # WGS84坐标系下的位置（惰性计算）
+        self._wgs84_y = 0.0
+        self._wgs84_dirty = False
         self.altitude = 0 # 当前高程
         self.heading = 0
         self.observers: List[GPSObserver] = []
-        self.last_sampled_position = self.position
-        self.coordinate_system = CRS.from_string(config.get_coordinate_system())
-        self.to_wgs84 = self._create_to_wgs84_transformer()
+        # 缓存绑定方法，分发时省去每观察者一次的属性查找
+        self._batch_callbacks = []
+        self._notify_buffer: List[Dict] = []
+        self.last_sampled_x = self.position_x
+        self.last_sampled_y = self.position_y
+        crs_string = config.get_coordinate_system()
+        self.coordinate_system = _get_crs(crs_string)
+        # 设备坐标系本身就是WGS84时无需任何转换，用布尔标记直达快路径
+        self._is_wgs84 = _is_wgs84_crs(crs_string)
+        self.to_wgs84 = self._create_to_wgs84_transformer(crs_string)
         self.time_unit = config.get_time_unit()
         self.time_unit_factor = self._get_time_unit_factor()
         self.sampling_strategy = SamplingStrategyFactory.create_sampling_strategy(config)
 
-    def _create_to_wgs84_transformer(self):
-        if self.coordinate_system == CRS.from_epsg(4326):
+    def _create_to_wgs84_transformer(self, crs_string: str):
+        if self._is_wgs84:
             return lambda x, y: (x, y)
         else:
-            return Transformer.from_crs(self.coordinate_system, CRS.from_epsg(4326), always_xy=True).transform
+            return _get_to_wgs84_transformer(crs_string)
 
     def _get_time_unit_factor(self):
         """获取时间单位转换因子"""
-        if self.time_unit == "millisecond":
-            return 0.001
-        elif self.time_unit == "minute":
-            return 60
-        elif self.time_unit == "hour":
-            return 3600
-        else:  # 默认为秒
-            return 1
+        return _TIME_UNIT_FACTORS.get(self.time_unit, 1)
 
     @abstractmethod
-    def update(self, elapsed_time: float, offset: Point) -> None:
+    def update(self, elapsed_time: float, offset_x: float, offset_y: float) -> None:
         """
         更新GPS设备状态
         
         :param elapsed_time: 经过的时间（以配置的时间单位为准）
-        :param offset: 相对当前位置的偏移
+        :param offset_x: 相对当前位置的X方向偏移
+        :param offset_y: 相对当前位置的Y方向偏移
         """
         raise NotImplementedError("not implemented")
 
     @abstractmethod
-    def get_data(self) -> Dict:
+    def get_data(self) -> GPSData:
         """
         获取当前GPS数据
         
-        :return: 包含位置、高程、时间戳等信息的字典
+        :return: 包含位置、高程、时间戳等信息的数据快照
         """
         raise NotImplementedError("not implemented")
 
+    @property
+    def position(self) -> Point:
+        """当前位置（按需构造Point对象）"""
+        return Point(self.position_x, self.position_y)
+
+    @property
+    def wgs84_position(self) -> Point:
+        """WGS84坐标系下的位置（按需构造Point对象）"""
+        return Point(self.wgs84_x, self.wgs84_y)
+
+    def _refresh_wgs84(self) -> None:
+        """把WGS84坐标同步到最新位置"""
+        if self._is_wgs84:
+            # 恒等转换：直接复制坐标，连lambda调用都省掉
+            self._wgs84_x, self._wgs84_y = self.position_x, self.position_y
+        else:
+            self._wgs84_x, self._wgs84_y = self.to_wgs84(self.position_x, self.position_y)
+        self._wgs84_dirty = False
+
+    @property
+    def wgs84_x(self) -> float:
+        """WGS84经度（首次访问时才做坐标转换）"""
+        if self._wgs84_dirty:
+            self._refresh_wgs84()
+        return self._wgs84_x
+
+    @property
+    def wgs84_y(self) -> float:
+        """WGS84纬度（首次访问时才做坐标转换）"""
+        if self._wgs84_dirty:
+            self._refresh_wgs84()
+        return self._wgs84_y
+
     def set_position(self, new_position: Point) -> None:
         """
         设置GPS设备的当前位置，并更新WGS84坐标
         
         :param new_position: 新的位置
         """
-        self.position = new_position
-        wgs84_x, wgs84_y = self.to_wgs84(new_position.x, new_position.y)
-        self.wgs84_position = Point(wgs84_x, wgs84_y)
+        self.set_position_xy(new_position.x, new_position.y)
+
+    def set_position_xy(self, x: float, y: float) -> None:
+        """
+        以标量坐标设置GPS设备的当前位置，并更新WGS84坐标
+
+        热路径直接传入浮点数，避免中间Point对象的构造。
+
+        :param x: 新位置X坐标
+        :param y: 新位置Y坐标
+        """
+        self.position_x = x
+        self.position_y = y
+        # 坐标转换推迟到真正需要WGS84坐标时（采样、高程查询），
+        # 未采样的tick完全不触发pyproj调用
+        self._wgs84_dirty = True
 
     def set_time(self, new_time: float) -> None:
         """
@@ -104,12 +309,15 @@ class GPSDevice(ABC):
             observer.on_gps_start_recording()
         
         self.record_data()# 记录初始数据
-        self.notify_observers(self.get_data())
+        if self._batch_callbacks:
+            self.notify_observers(self.get_data())
 
     def stop_recording(self) -> None:
         """停止记录轨迹"""
         self.record_data()# 记录结束数据
-        self.notify_observers(self.get_data())
+        if self._batch_callbacks:
+            self.notify_observers(self.get_data())
+        self.flush_observers()# 停止前把攒批中的数据全部送出
         self.is_recording = False
         self.is_paused = False
         for observer in self.observers:
@@ -132,7 +340,14 @@ class GPSDevice(ABC):
     def record_data(self) -> None:
         """记录当前GPS数据到轨迹中"""
         if self.is_recording and not self.is_paused:
-            self.trajectory.append(self.get_data())
+            self._append_record()
+
+    def _append_record(self) -> None:
+        """把当前状态按标量列写入轨迹（子类补充自己的附加列）"""
+        self.trajectory.append(self.position_x, self.position_y,
+                               self.wgs84_x, self.wgs84_y,
+                               self.altitude, self.current_time, self.heading,
+                               0.0, 0.0)
 
     def get_trajectory(self) -> List[Dict]:
         """
@@ -140,17 +355,40 @@ class GPSDevice(ABC):
         
         :return: 轨迹数据列表
         """
-        return self.trajectory
+        return self.trajectory.to_records()
+
+    @staticmethod
+    def _handles_updates(observer: GPSObserver) -> bool:
+        """观察者是否真正处理数据更新（重写了单条或批量回调）"""
+        cls = type(observer)
+        return (cls.on_gps_update is not GPSObserver.on_gps_update
+                or cls.on_gps_updates is not GPSObserver.on_gps_updates)
 
     def add_observer(self, observer: GPSObserver):
         self.observers.append(observer)
+        # 只有真正处理更新的观察者才进入分发列表，默认no-op回调连调用都省掉
+        if self._handles_updates(observer):
+            self._batch_callbacks.append(observer.on_gps_updates)
 
     def remove_observer(self, observer: GPSObserver):
         self.observers.remove(observer)
+        if self._handles_updates(observer):
+            self._batch_callbacks.remove(observer.on_gps_updates)
 
     def notify_observers(self, data: Dict):
-        for observer in self.observers:
-            observer.on_gps_update(data)
+        """攒批通知：数据先入缓冲，凑满一批再统一分发"""
+        self._notify_buffer.append(data)
+        if len(self._notify_buffer) >= self.NOTIFY_BATCH_SIZE:
+            self.flush_observers()
+
+    def flush_observers(self):
+        """把缓冲中的数据整批分发给所有观察者"""
+        if not self._notify_buffer:
+            return
+        batch = self._notify_buffer
+        self._notify_buffer = []
+        for callback in self._batch_callbacks:
+            callback(batch)
 
     def should_sample(self) -> bool:
         return self.sampling_strategy.should_sample(self)
@@ -161,4 +399,4 @@ class GPSDevice(ABC):
 
     def get_position_wgs84(self) -> Tuple[float, float]:
         """获取WGS84坐标系下的位置"""
-        return self.wgs84_position.x, self.wgs84_position.y
\ No newline at end of file
+        return self.wgs84_x, self.wgs84_y
\ No newline at end of file
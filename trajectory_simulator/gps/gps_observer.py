@@ -1,8 +1,14 @@
-from abc import ABC, abstractmethod
-from typing import Dict
+from abc import ABC
+from typing import Dict, List
 
 class GPSObserver(ABC):
-    @abstractmethod
+    """
+    GPS 事件观察者基类
+
+    所有回调都提供空的默认实现，子类只需重写自己关心的事件，
+    不必为不相关的回调写空方法。
+    """
+
     def on_gps_update(self, data: Dict):
         """
         当 GPS 数据更新时调用
@@ -11,28 +17,36 @@ class GPSObserver(ABC):
         """
         pass
 
-    @abstractmethod
+    def on_gps_updates(self, data_list: List[Dict]):
+        """
+        当一批 GPS 数据更新时调用
+
+        默认实现逐条转发给 on_gps_update；关心批量吞吐的观察者
+        可以重写本方法一次性处理整批数据。
+
+        :param data_list: 按时间顺序排列的一批 GPS 数据
+        """
+        for data in data_list:
+            self.on_gps_update(data)
+
     def on_gps_start_recording(self):
         """
         当 GPS 开始记录时调用
         """
         pass
 
-    @abstractmethod
     def on_gps_stop_recording(self):
         """
         当 GPS 停止记录时调用
         """
         pass
 
-    @abstractmethod
     def on_gps_pause_recording(self):
         """
         当 GPS 暂停记录时调用
         """
         pass
 
-    @abstractmethod
     def on_gps_resume_recording(self):
         """
         当 GPS 恢复记录时调用
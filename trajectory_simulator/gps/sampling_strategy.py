@@ -9,10 +9,14 @@ class SamplingStrategy(ABC):
 class DistanceSamplingStrategy(SamplingStrategy):
     def __init__(self, sampling_distance: float):
         self.sampling_distance = sampling_distance
+        # 预先平方阈值，逐tick的判断就不必开方
+        self._threshold_sq = sampling_distance * sampling_distance
 
     def should_sample(self, gps_device) -> bool:
-        current_distance = gps_device.position.distance(gps_device.last_sampled_position)
-        return current_distance >= self.sampling_distance
+        # 比较平方距离，距离比较在平方下单调，结果不变
+        dx = gps_device.position_x - gps_device.last_sampled_x
+        dy = gps_device.position_y - gps_device.last_sampled_y
+        return dx * dx + dy * dy >= self._threshold_sq
 
 class TimeSamplingStrategy(SamplingStrategy):
     def __init__(self, sampling_interval: float):
@@ -34,22 +38,32 @@ class HybridSamplingStrategy(SamplingStrategy):
     def should_sample(self, gps_device) -> bool:
         return self.distance_strategy.should_sample(gps_device) or self.time_strategy.should_sample(gps_device)
 
+def _create_distance_strategy(config: Config) -> SamplingStrategy:
+    sampling_distance = config.get(Config.GPS_SAMPLING_DISTANCE_KEY, 5.0)
+    return DistanceSamplingStrategy(sampling_distance)
+
+def _create_time_strategy(config: Config) -> SamplingStrategy:
+    sampling_interval = config.get(Config.GPS_SAMPLING_INTERVAL_KEY, 1.0)
+    return TimeSamplingStrategy(sampling_interval)
+
+def _create_hybrid_strategy(config: Config) -> SamplingStrategy:
+    return HybridSamplingStrategy(
+        _create_distance_strategy(config),
+        _create_time_strategy(config)
+    )
+
 class SamplingStrategyFactory:
+    # 策略名到构造函数的索引，O(1)查找代替逐个分支比较
+    _builders = {
+        "distance": _create_distance_strategy,
+        "time": _create_time_strategy,
+        "hybrid": _create_hybrid_strategy,
+    }
+
     @staticmethod
     def create_sampling_strategy(config: Config) -> SamplingStrategy:
         strategy_type = config.get(Config.GPS_SAMPLING_STRATEGY_KEY, "distance")
-        if strategy_type == "distance":
-            sampling_distance = config.get(Config.GPS_SAMPLING_DISTANCE_KEY, 5.0)
-            return DistanceSamplingStrategy(sampling_distance)
-        elif strategy_type == "time":
-            sampling_interval = config.get(Config.GPS_SAMPLING_INTERVAL_KEY, 1.0)
-            return TimeSamplingStrategy(sampling_interval)
-        elif strategy_type == "hybrid":
-            sampling_distance = config.get(Config.GPS_SAMPLING_DISTANCE_KEY, 5.0)
-            sampling_interval = config.get(Config.GPS_SAMPLING_INTERVAL_KEY, 1.0)
-            return HybridSamplingStrategy(
-                DistanceSamplingStrategy(sampling_distance),
-                TimeSamplingStrategy(sampling_interval)
-            )
-        else:
-            raise ValueError(f"Unknown sampling strategy: {strategy_type}")
\ No newline at end of file
+        builder = SamplingStrategyFactory._builders.get(strategy_type)
+        if builder is None:
+            raise ValueError(f"Unknown sampling strategy: {strategy_type}")
+        return builder(config)
\ No newline at end of file
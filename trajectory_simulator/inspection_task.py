@@ -1,6 +1,11 @@
+import logging
+import math
+import numpy as np
 from shapely.geometry import Point, Polygon, LineString
 from .config.config import Config
 
+logger = logging.getLogger(__name__)
+
 class InspectionTask:
     """巡检任务类，管理巡检路径和目标点"""
 
@@ -15,14 +20,23 @@ class InspectionTask:
         self.config = config
         self.target_index = 0
         self.current_edge = None
-        self.valid_vertices = list(polygon.exterior.coords)
+        # 顶点一次性抽成(N, 2)数组，后续按行索引读取裸浮点坐标
+        self.valid_vertices = np.asarray(polygon.exterior.coords)
+        # 收尾距离容差在模拟期间不变，初始化时读取一次
+        self.closing_distance = config.get(Config.CLOSING_DISTANCE_KEY)
         self.update_current_edge()
 
     def update_current_edge(self):
         """更新当前行进边"""
-        start = Point(self.valid_vertices[self.target_index])
-        end = Point(self.valid_vertices[(self.target_index + 1) % len(self.valid_vertices)])
+        # 几何对象只在边切换时构造一次，逐tick的判断全部走标量缓存
+        start = self.valid_vertices[self.target_index]
+        end = self.valid_vertices[(self.target_index + 1) % len(self.valid_vertices)]
         self.current_edge = LineString([start, end])
+        # 目标点在一条边内保持不变，随行进边一起缓存，每条边只构造一次；
+        # 终点坐标同时以标量缓存，供逐tick的到达判断使用
+        self._end_x = float(end[0])
+        self._end_y = float(end[1])
+        self.next_target = Point(self._end_x, self._end_y)
 
     def get_next_target(self) -> Point:
         """
@@ -32,9 +46,8 @@ class InspectionTask:
         """
         if self.target_index >= len(self.valid_vertices) - 1:
             return None
-        
-        target = Point(self.valid_vertices[self.target_index + 1])
-        return target
+
+        return self.next_target
     
     def is_on_current_edge(self, point: Point, tolerance: float = 1e-6) -> bool:
         """
@@ -44,12 +57,28 @@ class InspectionTask:
         :param tolerance: 容差值
         :return: 是否在当前行进边的终点或其延长线上
         """
-        end_point = Point(self.current_edge.coords[-1])
+        return self.is_on_current_edge_xy(point.x, point.y, tolerance)
+
+    def is_on_current_edge_xy(self, x: float, y: float, tolerance: float = 1e-6) -> bool:
+        """
+        检查坐标是否在当前行进边的终点或其延长线上（纯标量路径）
+
+        :param x: 要检查的X坐标
+        :param y: 要检查的Y坐标
+        :param tolerance: 容差值
+        :return: 是否在当前行进边的终点或其延长线上
+        """
+        # 平方距离比较，省去每tick的Point构造、GEOS调用和开方
+        dx = x - self._end_x
+        dy = y - self._end_y
+        distance_sq = dx * dx + dy * dy
         if self.target_index == len(self.valid_vertices) - 1:  # 如果是最后一条边
-            print(f"最后一条边，距离终点距离: {point.distance(end_point)}")
-            closing_distance = self.config.get(Config.CLOSING_DISTANCE_KEY, tolerance)
-            return point.distance(end_point) < closing_distance
-        return point.distance(end_point) < tolerance
+            # 调试输出走日志并先判级别，默认级别下连开方都不做
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("最后一条边，距离终点距离: %s", math.sqrt(distance_sq))
+            closing_distance = self.closing_distance if self.closing_distance is not None else tolerance
+            return distance_sq < closing_distance * closing_distance
+        return distance_sq < tolerance * tolerance
 
     def move_to_next_target(self) -> bool:
         """
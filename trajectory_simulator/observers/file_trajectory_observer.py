@@ -1,5 +1,6 @@
 from .trajectory_observer import TrajectoryObserver
 from typing import Dict
+import atexit
 from shapely.geometry import Point
 
 class FileTrajectoryObserver(TrajectoryObserver):
@@ -7,14 +8,23 @@ class FileTrajectoryObserver(TrajectoryObserver):
 
     def __init__(self, filename: str):
         self.filename = filename
-        with open(self.filename, 'w') as f:
-            f.write("event,x,y,altitude,timestamp,heading,accuracy\n")
+        # 文件只打开一次并带用户态缓冲，每个事件不再经历打开/关闭两次系统调用
+        self._file = open(self.filename, 'w', buffering=1 << 16)
+        self._file.write("event,x,y,altitude,timestamp,heading,accuracy\n")
+        # 进程退出时兜底刷出缓冲（正常流程在 stop_recording 时已刷出）
+        atexit.register(self.close)
+
+    def close(self):
+        """刷出缓冲并关闭输出文件（可重复调用）"""
+        if not self._file.closed:
+            self._file.close()
 
     def on_start_recording(self):
         self._write_event("start_recording")
 
     def on_stop_recording(self):
         self._write_event("stop_recording")
+        self._file.flush()
 
     def on_pause_recording(self):
         self._write_event("pause_recording")
@@ -45,5 +55,4 @@ class FileTrajectoryObserver(TrajectoryObserver):
         self._write_event("simulation_failure", max_attempts=data['max_attempts'])
 
     def _write_event(self, event: str, x: float = None, y: float = None, altitude: float = None, timestamp: float = None, heading: float = None, accuracy: float = None, attempt: int = None, max_attempts: int = None):
-        with open(self.filename, 'a') as f:
-            f.write(f"{event},{x},{y},{altitude},{timestamp},{heading},{accuracy},{attempt},{max_attempts}\n")
\ No newline at end of file
+        self._file.write(f"{event},{x},{y},{altitude},{timestamp},{heading},{accuracy},{attempt},{max_attempts}\n")
\ No newline at end of file
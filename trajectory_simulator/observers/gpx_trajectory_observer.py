@@ -1,8 +1,8 @@
 from typing import Dict
-import xml.etree.ElementTree as ET
-from datetime import datetime, timezone, timedelta
-from shapely.geometry import Point, Polygon
-from ..trajectory_simulator import TrajectoryObserver
+from array import array
+import numpy as np
+from xml.sax.saxutils import escape
+from ..trajectory_simulator import TrajectoryObserver, _shoelace_area
 from ..gps.gps_device import POSITION_KEY, ALTITUDE_KEY, TIMESTAMP_KEY, WGS84_POSITION_KEY
 
 
@@ -19,7 +19,7 @@ class GPXTrajectoryObserver(TrajectoryObserver):
     def __init__(self, file_path: str, config: Dict, elevation_provider=None):
         """
         初始化GPX轨迹观察者
-        
+
         :param file_path: 输出的GPX文件路径
         :param config: 配置字典，包含GPX文件的元数据信息
         :param elevation_provider: 高程数据提供者
@@ -29,107 +29,119 @@ class GPXTrajectoryObserver(TrajectoryObserver):
         self.elevation_provider = elevation_provider
         self.initial_time = None
 
-        # 创建GPX根元素，设置版本和创建者
-        self.root = ET.Element("gpx", version="1.1", 
-                               creator=self.config.get(self.CREATOR_KEY, "ArcGIS Trajectory Simulator"))
-        # 添加元数据、轨迹和轨迹段元素
-        self.metadata = ET.SubElement(self.root, "metadata")
-        self.track = ET.SubElement(self.root, "trk")
-        self.segment = ET.SubElement(self.track, "trkseg")
-        # 初始化轨迹点列表和时间记录
-        self.trajectory = []
-        self.start_time = None
-        self.end_time = None
+        # 轨迹点采用SoA布局：坐标与时间戳（Unix秒）分列存储。
+        # array('d')紧凑存放裸double，numpy可经缓冲区协议零拷贝读取
+        self.lons = array('d')
+        self.lats = array('d')
+        self.timestamps = array('d')
 
     def on_start_recording(self):
-        """开始记录时的操作，添加元数据和轨迹名称"""
-        # 设置元数据名称
-        ET.SubElement(self.metadata, "name").text = self.config.get(self.METADATA_NAME_KEY, "Simulated Trajectory")
-        # 设置轨迹名称
-        ET.SubElement(self.track, "name").text = self.config.get(self.TRACK_NAME_KEY, "Simulated Track")
-        
-        # 添加其他可能的元数据
-        if self.METADATA_DESCRIPTION_KEY in self.config:
-            ET.SubElement(self.metadata, "desc").text = self.config[self.METADATA_DESCRIPTION_KEY]
-        if self.METADATA_AUTHOR_KEY in self.config:
-            author = ET.SubElement(self.metadata, "author")
-            ET.SubElement(author, "name").text = self.config[self.METADATA_AUTHOR_KEY]
+        """开始记录时的操作"""
+        pass
 
     def on_stop_recording(self):
-        """停止记录时的操作，添加扩展信息并写入GPX文件"""
-        self._add_elevations()
-        self._add_extensions()
-        tree = ET.ElementTree(self.root)
-        tree.write(self.file_path, encoding="utf-8", xml_declaration=True)
+        """停止记录时的操作，统一添加高程并写入GPX文件"""
+        elevations = self._get_elevations()
+        self._write_gpx(elevations)
 
     def on_data_update(self, data: Dict):
         """
         更新轨迹数据
-        
+
         :param data: 包含位置、时间戳和高程信息的字典
         """
         wgs84_position = data[WGS84_POSITION_KEY]
-        timestamp = datetime.fromtimestamp(data[TIMESTAMP_KEY], tz=timezone.utc)
 
-        # 创建轨迹点元素，但暂不添加高程信息
-        trkpt = ET.SubElement(self.segment, "trkpt", lat=str(wgs84_position.y), lon=str(wgs84_position.x))
-        ET.SubElement(trkpt, "time").text = timestamp.isoformat()
+        # 记录轨迹点信息（只保存标量坐标和原始时间戳，不构造datetime对象）
+        self.lons.append(wgs84_position.x)
+        self.lats.append(wgs84_position.y)
+        self.timestamps.append(data[TIMESTAMP_KEY])
 
-        # 记录轨迹点信息
-        self.trajectory.append((wgs84_position, timestamp, trkpt))
+    def _get_elevations(self):
+        """在记录结束后统一获取高程信息"""
+        if self.elevation_provider:
+            lons = np.frombuffer(self.lons, dtype=np.float64)
+            lats = np.frombuffer(self.lats, dtype=np.float64)
+            return self.elevation_provider.batch_get_elevation(lons, lats)
+        return None
 
-        # 更新开始和结束时间
-        if self.start_time is None:
-            self.start_time = timestamp
-        self.end_time = timestamp
+    def _format_times(self):
+        """
+        将全部时间戳一次性转换为ISO 8601字符串（UTC）
 
-    def _add_elevations(self):
-        """在记录结束后统一添加高程信息"""
-        if self.elevation_provider:
-            lon_lat_list = [(point[0].x, point[0].y) for point in self.trajectory]
-            elevations = self.elevation_provider.batch_get_elevation(lon_lat_list)
-            
-            for (_, _, trkpt), elevation in zip(self.trajectory, elevations):
-                ET.SubElement(trkpt, "ele").text = str(elevation)
-
-    def _add_extensions(self):
-        """添加扩展信息，包括开始时间、结束时间、总距离和面积"""
-        extensions = ET.SubElement(self.track, "extensions")
-        ET.SubElement(extensions, "starttime").text = self.start_time.isoformat()
-        ET.SubElement(extensions, "endtime").text = self.end_time.isoformat()
-        
-        total_distance = self._calculate_total_distance()
-        ET.SubElement(extensions, "length").text = str(total_distance)
-        
-        area = self._calculate_area()
-        ET.SubElement(extensions, "area").text = str(area)
+        :return: 与轨迹点对应的时间字符串数组
+        """
+        micros = (np.frombuffer(self.timestamps, dtype=np.float64) * 1e6).astype(np.int64)
+        # 时间戳全为整秒时输出到秒，否则保留微秒精度
+        unit = 's' if not (micros % 1_000_000).any() else 'us'
+        return np.datetime_as_string(micros.astype('datetime64[us]'), unit=unit, timezone='UTC')
+
+    def _write_gpx(self, elevations):
+        """
+        直接以字符串形式写出GPX文件，避免构建ElementTree再序列化
+
+        :param elevations: 高程数组，为None时不写ele元素
+        """
+        times = self._format_times()
+        with open(self.file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            creator = escape(self.config.get(self.CREATOR_KEY, "ArcGIS Trajectory Simulator"), {'"': "&quot;"})
+            f.write(f'<gpx version="1.1" creator="{creator}">')
+
+            # 元数据
+            f.write("<metadata>")
+            f.write(f"<name>{escape(self.config.get(self.METADATA_NAME_KEY, 'Simulated Trajectory'))}</name>")
+            if self.METADATA_DESCRIPTION_KEY in self.config:
+                f.write(f"<desc>{escape(self.config[self.METADATA_DESCRIPTION_KEY])}</desc>")
+            if self.METADATA_AUTHOR_KEY in self.config:
+                f.write(f"<author><name>{escape(self.config[self.METADATA_AUTHOR_KEY])}</name></author>")
+            f.write("</metadata>")
+
+            # 轨迹与轨迹段
+            f.write(f"<trk><name>{escape(self.config.get(self.TRACK_NAME_KEY, 'Simulated Track'))}</name>")
+            f.write("<trkseg>\n")
+            if elevations is not None:
+                for lon, lat, time_str, elevation in zip(self.lons, self.lats, times, elevations):
+                    f.write(f'<trkpt lat="{lat}" lon="{lon}"><ele>{elevation}</ele>'
+                            f'<time>{time_str}</time></trkpt>\n')
+            else:
+                for lon, lat, time_str in zip(self.lons, self.lats, times):
+                    f.write(f'<trkpt lat="{lat}" lon="{lon}"><time>{time_str}</time></trkpt>\n')
+            f.write("</trkseg>")
+
+            # 扩展信息：开始时间、结束时间、总距离和面积
+            f.write("<extensions>")
+            f.write(f"<starttime>{times[0]}</starttime>")
+            f.write(f"<endtime>{times[-1]}</endtime>")
+            f.write(f"<length>{self._calculate_total_distance()}</length>")
+            f.write(f"<area>{self._calculate_area()}</area>")
+            f.write("</extensions>")
+
+            f.write("</trk></gpx>")
 
     def _calculate_total_distance(self):
         """
         计算轨迹的总距离
-        
+
         :return: 总距离（米）
         """
-        if len(self.trajectory) < 2:
+        if len(self.lons) < 2:
             return 0
-        
-        total_distance = 0
-        for i in range(1, len(self.trajectory)):
-            p1 = self.trajectory[i-1][0]
-            p2 = self.trajectory[i][0]
-            total_distance += p1.distance(p2)
-        
-        return total_distance
+
+        # 相邻点差分后一次hypot求和，整条轨迹只走numpy的C循环
+        dlons = np.diff(np.frombuffer(self.lons, dtype=np.float64))
+        dlats = np.diff(np.frombuffer(self.lats, dtype=np.float64))
+        return float(np.hypot(dlons, dlats).sum())
 
     def _calculate_area(self):
         """
         计算轨迹围成的多边形面积
-        
+
         :return: 面积（平方米）
         """
-        if len(self.trajectory) < 3:
+        if len(self.lons) < 3:
             return 0
-        
-        points = [point[0] for point in self.trajectory]
-        polygon = Polygon(points)
-        return polygon.area
\ No newline at end of file
+
+        # 鞋带公式直接作用在坐标数组上，不经过GEOS多边形构建
+        return _shoelace_area(np.frombuffer(self.lons, dtype=np.float64),
+                              np.frombuffer(self.lats, dtype=np.float64))
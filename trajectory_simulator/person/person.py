@@ -1,11 +1,123 @@
 from abc import ABC, abstractmethod
-import random
 import math
 from typing import List,Dict
-from shapely.geometry import Point, Polygon
+import numpy as np
+from shapely.geometry import Point, Polygon, LineString
+from shapely.strtree import STRtree
 from ..config.config import Config
 from ..gps.gps_device import GPSDevice
 
+try:
+    # numba 是可选依赖，安装后热路径内核会被JIT编译
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _make_step_kernel(deviation_probability: float, max_deviation_angle: float,
+                      min_speed: float, max_speed: float):
+    """
+    生成绑定了人员参数的移动内核
+
+    参数在整个模拟期间固定，作为闭包常量传入后JIT可以将其常量折叠进
+    每步的数学计算；相同参数组合的内核只编译一次并缓存复用。
+
+    :param deviation_probability: 偏航概率
+    :param max_deviation_angle: 最大偏航角度（度）
+    :param min_speed: 最小速度
+    :param max_speed: 最大速度
+    :return: 内核函数 (x, y, tx, ty, distance_factor, r_prob, r_dev, r_speed) -> (new_x, new_y)
+    """
+    key = (deviation_probability, max_deviation_angle, min_speed, max_speed)
+    kernel = _step_kernel_cache.get(key)
+    if kernel is not None:
+        return kernel
+
+    speed_span = max_speed - min_speed
+
+    def _advance_position(x, y, tx, ty, distance_factor, r_prob, r_dev, r_speed):
+        # 计算指向目标的单位方向向量，代替 atan2 + 角度换算
+        dx = tx - x
+        dy = ty - y
+        length = math.sqrt(dx * dx + dy * dy)
+        if length > 0.0:
+            ux = dx / length
+            uy = dy / length
+        else:
+            ux = 0.0
+            uy = 0.0
+
+        # 模拟偏航：有一定概率偏离预定航向，仅在偏航时才计算三角函数
+        if r_prob < deviation_probability:
+            # 在最大偏航角度范围内随机选择一个偏航角度，旋转单位向量
+            angle = math.radians((2.0 * r_dev - 1.0) * max_deviation_angle)
+            cos_a = math.cos(angle)
+            sin_a = math.sin(angle)
+            ux, uy = cos_a * ux - sin_a * uy, sin_a * ux + cos_a * uy
+
+        # 计算移动距离：速度 * 时间
+        distance = (min_speed + speed_span * r_speed) * distance_factor
+
+        # 旋转后的方向向量仍为单位长度，直接按距离平移
+        return (x + distance * ux, y + distance * uy)
+
+    if njit is not None:
+        # 显式签名使内核在创建时即完成编译；闭包捕获的参数成为编译期常量
+        _advance_position = njit(
+            'UniTuple(f8, 2)(f8, f8, f8, f8, f8, f8, f8, f8)',
+            fastmath=True)(_advance_position)
+
+    _step_kernel_cache[key] = _advance_position
+    return _advance_position
+
+
+# 参数组合到已编译内核的缓存，避免每次模拟尝试重复编译
+_step_kernel_cache = {}
+
+
+def _nearest_on_segments(seg_starts, seg_vectors, seg_len2, px, py):
+    """
+    单遍扫描求点到一组线段的最近点
+
+    融合距离计算与argmin，不产生任何中间数组；有numba时编译为
+    紧凑的原生循环。
+
+    :param seg_starts: (N, 2)线段起点数组
+    :param seg_vectors: (N, 2)线段向量数组
+    :param seg_len2: (N,)线段长度平方数组（零长度段已置1）
+    :param px: 点的X坐标
+    :param py: 点的Y坐标
+    :return: (最近距离, 最近点X, 最近点Y)
+    """
+    best_dist_sq = np.inf
+    best_x = px
+    best_y = py
+    for i in range(seg_starts.shape[0]):
+        ax = seg_starts[i, 0]
+        ay = seg_starts[i, 1]
+        dx = seg_vectors[i, 0]
+        dy = seg_vectors[i, 1]
+        t = ((px - ax) * dx + (py - ay) * dy) / seg_len2[i]
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
+        qx = ax + t * dx
+        qy = ay + t * dy
+        dist_sq = (qx - px) * (qx - px) + (qy - py) * (qy - py)
+        if dist_sq < best_dist_sq:
+            best_dist_sq = dist_sq
+            best_x = qx
+            best_y = qy
+    return math.sqrt(best_dist_sq), best_x, best_y
+
+
+if njit is not None:
+    _nearest_on_segments = njit(
+        'UniTuple(f8, 3)(f8[:, ::1], f8[:, ::1], f8[::1], f8, f8)',
+        cache=True, fastmath=True)(_nearest_on_segments)
+
+
 class PersonObserver(ABC):
     @abstractmethod
     def on_person_move(self, data: Dict):
@@ -31,9 +143,64 @@ class MovementStrategy(ABC):
         """
         pass
 
+    def move_xy(self, x: float, y: float, tx: float, ty: float,
+                elapsed_time: float, config: Config):
+        """
+        计算下一个移动位置（标量坐标接口）
+
+        默认实现包装为Point后委托给move()，自定义策略只需实现move()；
+        内置策略可重写本方法提供免Point构造的快速路径。
+
+        :param x: 当前位置X坐标
+        :param y: 当前位置Y坐标
+        :param tx: 目标X坐标
+        :param ty: 目标Y坐标
+        :param elapsed_time: 经过的时间
+        :param config: 配置对象
+        :return: 新位置坐标 (new_x, new_y)
+        """
+        new_position = self.move(Point(x, y), Point(tx, ty), elapsed_time, config)
+        return new_position.x, new_position.y
+
 class RealisticMovementStrategy(MovementStrategy):
     """真实场景的移动策略，包含偏航和纠偏逻辑"""
 
+    # 每批预生成的随机数个数
+    RANDOM_BLOCK_SIZE = 256
+
+    def __init__(self, config: Config):
+        """
+        初始化移动策略，并把模拟期间不变的配置固化为实例属性
+
+        :param config: 配置对象
+        """
+        # 成批预生成随机数，避免每步多次调用Python层的RNG；
+        # 每个策略实例持有自己的PCG64生成器，配置种子后结果可复现
+        self._rng = np.random.default_rng(config.get(Config.SIMULATION_SEED_KEY))
+        self._randoms = self._rng.random((self.RANDOM_BLOCK_SIZE, 3))
+        self._random_index = 0
+        # 人员参数在整个模拟期间固定，初始化时即生成绑定参数的内核
+        deviation_probability = config.get(Config.PERSON_DEVIATION_PROBABILITY_KEY, 0.1)
+        max_deviation_angle = config.get(Config.PERSON_MAX_DEVIATION_ANGLE_KEY, 10.0)
+        speed_range = config.get(Config.PERSON_SPEED_RANGE_KEY, (0.8, 1.5))
+        self._step_kernel = _make_step_kernel(
+            deviation_probability, max_deviation_angle,
+            speed_range[0], speed_range[1])
+        self._time_step = config.get(Config.TIME_STEP_KEY, 1.0)
+
+    def _next_randoms(self):
+        """
+        取出下一组预生成的随机数，耗尽时整批补充
+
+        :return: 三个[0,1)随机数，分别用于偏航判定、偏航角度和速度
+        """
+        if self._random_index >= self.RANDOM_BLOCK_SIZE:
+            self._rng.random(out=self._randoms)
+            self._random_index = 0
+        r_prob, r_dev, r_speed = self._randoms[self._random_index]
+        self._random_index += 1
+        return r_prob, r_dev, r_speed
+
     def move(self, gps_position: Point, target: Point, elapsed_time: float, config: Config) -> Point:
         """
         计算下一个移动位置，考虑偏航因素
@@ -43,33 +210,36 @@ class RealisticMovementStrategy(MovementStrategy):
         :param config: 配置对象
         :return: 计算得到的新位置
         """
-        # 计算当前位置到目标位置的方向角（航向）
-        dx = target.x - gps_position.x
-        dy = target.y - gps_position.y
-        heading = math.degrees(math.atan2(dy, dx))
-
-        # 模拟偏航：有一定概率偏离预定航向
-        deviation_probability = config.get(Config.PERSON_DEVIATION_PROBABILITY_KEY, 0.1)
-        max_deviation_angle = config.get(Config.PERSON_MAX_DEVIATION_ANGLE_KEY, 10.0)
-        if random.random() < deviation_probability:
-            # 在最大偏航角度范围内随机选择一个偏航角度
-            heading += random.uniform(-max_deviation_angle, max_deviation_angle)
+        new_x, new_y = self.move_xy(gps_position.x, gps_position.y,
+                                    target.x, target.y, elapsed_time, config)
+        return Point(new_x, new_y)
 
-        # 计算移动距离：速度 * 时间
-        speed_range = config.get(Config.PERSON_SPEED_RANGE_KEY, (0.8, 1.5))
-        speed = random.uniform(*speed_range)  # 在速度范围内随机选择一个速度
-        time_step = config.get("simulation.time_step", 1.0)
-        distance = speed * time_step * elapsed_time
+    def move_xy(self, x: float, y: float, tx: float, ty: float,
+                elapsed_time: float, config: Config):
+        """
+        计算下一个移动位置（纯标量路径，热循环使用）
 
-        # 计算新位置：使用极坐标到直角坐标的转换
-        new_x = gps_position.x + distance * math.cos(math.radians(heading))
-        new_y = gps_position.y + distance * math.sin(math.radians(heading))
+        :param x: 当前位置X坐标
+        :param y: 当前位置Y坐标
+        :param tx: 目标X坐标
+        :param ty: 目标Y坐标
+        :param elapsed_time: 经过的时间
+        :param config: 配置对象
+        :return: 新位置坐标 (new_x, new_y)
+        """
+        r_prob, r_dev, r_speed = self._next_randoms()
 
-        return Point(new_x, new_y)
+        # 纯标量内核完成每步的数学计算，配置项已在初始化时固化
+        return self._step_kernel(x, y, tx, ty,
+                                 self._time_step * elapsed_time,
+                                 r_prob, r_dev, r_speed)
 
 class Person:
     """模拟人的移动行为的类"""
 
+    # 边界分段数超过该值时用STRtree做最近段查询，小多边形线性扫描更快
+    SEGMENT_TREE_THRESHOLD = 128
+
     def __init__(self, config: Config, gps: GPSDevice, actual_polygon: Polygon):
         """
         初始化Person对象
@@ -81,8 +251,32 @@ class Person:
         self.config = config
         self.gps = gps
         self.actual_polygon = actual_polygon
-        self.movement_strategy = RealisticMovementStrategy()
-        self.position = self.gps.position
+        # 边界几何在模拟期间不变：顶点与分段向量一次性抽成numpy数组，
+        # 逐tick的距离/投影计算不再经过GEOS
+        exterior_coords = np.asarray(actual_polygon.exterior.coords)
+        self._seg_starts = np.ascontiguousarray(exterior_coords[:-1])
+        self._seg_vectors = np.ascontiguousarray(np.diff(exterior_coords, axis=0))
+        seg_len2 = (self._seg_vectors ** 2).sum(axis=1)
+        # 零长度段的除数置1，其t值会被clip到0，即退化为到端点的距离
+        self._seg_len2 = np.where(seg_len2 > 0.0, seg_len2, 1.0)
+        if len(self._seg_starts) > self.SEGMENT_TREE_THRESHOLD:
+            # 障碍繁多的大多边形：O(log N)的最近段查询代替逐段扫描
+            segments = [LineString(exterior_coords[i:i + 2])
+                        for i in range(len(exterior_coords) - 1)]
+            self._segment_tree = STRtree(segments)
+        else:
+            self._segment_tree = None
+        self.movement_strategy = RealisticMovementStrategy(config)
+        self.position_x = self.gps.position_x
+        self.position_y = self.gps.position_y
+        # 纠偏参数在模拟期间不变，初始化时读取一次，避免每步查询配置
+        self.correction_threshold = config.get(Config.PERSON_CORRECTION_THRESHOLD_KEY, 5.0)
+        self.correction_factor = config.get(Config.PERSON_CORRECTION_FACTOR_KEY, 0.5)
+
+    @property
+    def position(self) -> Point:
+        """当前位置（按需构造Point对象）"""
+        return Point(self.position_x, self.position_y)
 
     def move(self, target: Point, elapsed_time: float) -> Point:
         """
@@ -92,17 +286,65 @@ class Person:
         :param elapsed_time: 经过的时间
         :return: 移动后的新位置
         """
-        gps_position = self.gps.position
-        new_position = self.movement_strategy.move(gps_position, target, elapsed_time, self.config)
-        
-        # 检查是否需要纠正航向，如果需要则进行纠正
-        if self.needs_course_correction(new_position):
-            new_position = self.correct_course(new_position, target)
-        
+        new_x, new_y = self.move_xy(target.x, target.y, elapsed_time)
+        return Point(new_x, new_y)
+
+    def move_xy(self, tx: float, ty: float, elapsed_time: float):
+        """
+        执行一步移动，包括偏航纠正（纯标量路径，热循环使用）
+
+        :param tx: 目标X坐标
+        :param ty: 目标Y坐标
+        :param elapsed_time: 经过的时间
+        :return: 移动后的新位置坐标 (new_x, new_y)
+        """
+        new_x, new_y = self.movement_strategy.move_xy(
+            self.gps.position_x, self.gps.position_y, tx, ty, elapsed_time, self.config)
+
+        # 检查是否需要纠正航向，如果需要则进行纠正。
+        # 单位向量 * 距离 * 因子 == 修正向量 * 因子，无需开方和除法
+        distance, nearest_x, nearest_y = self._nearest_point_on_exterior(new_x, new_y)
+        if distance > self.correction_threshold:
+            new_x = new_x + (nearest_x - new_x) * self.correction_factor
+            new_y = new_y + (nearest_y - new_y) * self.correction_factor
+
         # 更新自身位置
-        self.position = new_position
-        
-        return new_position
+        self.position_x = new_x
+        self.position_y = new_y
+
+        return new_x, new_y
+
+    def _nearest_point_on_exterior(self, px: float, py: float):
+        """
+        求边界上距给定点最近的点
+
+        对预先抽取的分段数组做一次向量化的点到线段投影，
+        代替GEOS的distance/project/interpolate逐段扫描。
+
+        :param px: 点的X坐标
+        :param py: 点的Y坐标
+        :return: (最近距离, 最近点X, 最近点Y)
+        """
+        if self._segment_tree is not None:
+            # 树定位最近段后，对单段做标量投影
+            i = int(self._segment_tree.nearest(Point(px, py)))
+            ax, ay = self._seg_starts[i]
+            dx, dy = self._seg_vectors[i]
+            t = ((px - ax) * dx + (py - ay) * dy) / self._seg_len2[i]
+            t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+            qx = ax + t * dx
+            qy = ay + t * dy
+            return math.hypot(qx - px, qy - py), qx, qy
+        if njit is not None:
+            return _nearest_on_segments(self._seg_starts, self._seg_vectors,
+                                        self._seg_len2, px, py)
+        # 无numba时退回向量化numpy实现
+        offsets = np.array((px, py)) - self._seg_starts
+        t = np.clip((offsets * self._seg_vectors).sum(axis=1) / self._seg_len2, 0.0, 1.0)
+        projections = self._seg_starts + t[:, None] * self._seg_vectors
+        dist_sq = ((projections - (px, py)) ** 2).sum(axis=1)
+        index = dist_sq.argmin()
+        return math.sqrt(dist_sq[index]), projections[index, 0], projections[index, 1]
 
     def needs_course_correction(self, position: Point) -> bool:
         """
@@ -111,10 +353,9 @@ class Person:
         :param position: 当前位置
         :return: 是否需要修正
         """
-        # 获取纠正阈值，即允许偏离多边形边界的最大距离
-        correction_threshold = self.config.get(Config.PERSON_CORRECTION_THRESHOLD_KEY, 5.0)
-        # 计算当前位置到多边形边界的距离，如果大于阈值则需要纠正
-        return self.actual_polygon.exterior.distance(position) > correction_threshold
+        # 计算当前位置到多边形边界的距离，如果大于纠正阈值则需要纠正
+        distance, _, _ = self._nearest_point_on_exterior(position.x, position.y)
+        return distance > self.correction_threshold
 
     def correct_course(self, position: Point, target: Point) -> Point:
         """
@@ -125,23 +366,14 @@ class Person:
         :return: 修正后的位置
         """
         # 找到多边形边界上距离当前位置最近的点
-        nearest_point = self.actual_polygon.exterior.interpolate(self.actual_polygon.exterior.project(position))
-        
-        # 计算从当前位置到最近点的矢量
-        correction_vector = (nearest_point.x - position.x, nearest_point.y - position.y)
-        correction_distance = math.sqrt(correction_vector[0]**2 + correction_vector[1]**2)
+        _, nearest_x, nearest_y = self._nearest_point_on_exterior(position.x, position.y)
         
-        if correction_distance > 0:
-            # 计算单位矢量
-            unit_vector = (correction_vector[0] / correction_distance, correction_vector[1] / correction_distance)
-            # 获取纠正因子，决定向最近点移动的程度
-            correction_factor = self.config.get(Config.PERSON_CORRECTION_FACTOR_KEY, 0.5)
-            # 计算纠正后的新位置
-            return Point(
-                position.x + unit_vector[0] * correction_distance * correction_factor,
-                position.y + unit_vector[1] * correction_distance * correction_factor
-            )
-        return position  # 如果距离为0，则不需要纠正
+        # 单位矢量 * 距离 * 因子可约简为修正矢量 * 因子；
+        # 距离为0时修正矢量为零向量，结果即原位置，无需单独分支
+        return Point(
+            position.x + (nearest_x - position.x) * self.correction_factor,
+            position.y + (nearest_y - position.y) * self.correction_factor
+        )
 
 
 
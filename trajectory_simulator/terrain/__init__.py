@@ -1,2 +1,9 @@
 from .elevation_provider import ElevationProvider
-from .arcgis_elevation_provider import ArcgisElevationProvider
\ No newline at end of file
+
+
+def __getattr__(name):
+    """按需导入依赖arcpy的提供者，避免包导入时付出 import arcpy 的代价"""
+    if name == "ArcgisElevationProvider":
+        from .arcgis_elevation_provider import ArcgisElevationProvider
+        return ArcgisElevationProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,8 @@
 from .elevation_provider import ElevationProvider
 import arcpy
-import arcpy.sa as sa
-import os
-import re
+import numpy as np
+from shapely.geometry import box
+from shapely.strtree import STRtree
 
 class ArcgisElevationProvider(ElevationProvider):
     """
@@ -15,23 +15,26 @@ class ArcgisElevationProvider(ElevationProvider):
         参数:
             dem_path_list (list): DEM文件路径列表
         """
-        self.dem_dict = {}
-        self.dem_bounds = {}
-        for dem_path in dem_path_list:
-            raster = arcpy.Raster(dem_path)
-            self.dem_dict[dem_path] = raster
-            
-            # 获取DEM的经纬度范围
-            extent = raster.extent
-            self.dem_bounds[dem_path] = {
-                "min_lon": extent.XMin,
-                "max_lon": extent.XMax,
-                "min_lat": extent.YMin,
-                "max_lat": extent.YMax
-            }
-        
+        # DEM元数据按整数下标平行存放（SoA）：路径、栅格对象、
+        # (K, 4)范围矩阵 [min_lon, max_lon, min_lat, max_lat]、(K, 2)像元尺寸，
+        # 范围与像元尺寸是连续数组，可直接参与广播计算
+        self._dem_paths = list(dem_path_list)
+        self._dem_rasters = [arcpy.Raster(dem_path) for dem_path in dem_path_list]
+        self._bounds_arr = np.array(
+            [(r.extent.XMin, r.extent.XMax, r.extent.YMin, r.extent.YMax)
+             for r in self._dem_rasters]).reshape(-1, 4)
+        self._cell_sizes = np.array(
+            [(r.meanCellWidth, r.meanCellHeight) for r in self._dem_rasters]).reshape(-1, 2)
+
         self.spatial_reference = arcpy.SpatialReference(4326)  # WGS84
 
+        # 多DEM时用STRtree做范围索引，把包含查询从线性扫描降为对数级
+        if len(self._dem_paths) > 1:
+            extent_boxes = [box(b[0], b[2], b[1], b[3]) for b in self._bounds_arr]
+            self._extent_tree = STRtree(extent_boxes)
+        else:
+            self._extent_tree = None
+
     def _get_applicable_dem(self, lon, lat):
         """
         根据给定的经纬度获取适用的DEM
@@ -43,53 +46,114 @@ class ArcgisElevationProvider(ElevationProvider):
         返回:
             arcpy.Raster: 适用的DEM栅格对象，如果没有找到则返回None
         """
-        for dem_path, bounds in self.dem_bounds.items():
-            if (bounds['min_lon'] <= lon <= bounds['max_lon'] and
-                bounds['min_lat'] <= lat <= bounds['max_lat']):
-                return self.dem_dict[dem_path]
+        for index in self._candidate_dems(lon, lat, lon, lat):
+            min_lon, max_lon, min_lat, max_lat = self._bounds_arr[index]
+            if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat:
+                return self._dem_rasters[index]
         return None
-    
-    def batch_get_elevation(self, lon_lat_list):
-        # 创建临时点要素类
-        temp_workspace = arcpy.env.scratchGDB
-        temp_points = os.path.join(temp_workspace, "temp_points")
-        arcpy.CreateFeatureclass_management(temp_workspace, "temp_points", "POINT", spatial_reference=self.spatial_reference)
-        
-        arcpy.AddField_management(temp_points, "PointID", "LONG")
-        arcpy.AddField_management(temp_points, "X", "DOUBLE")
-        arcpy.AddField_management(temp_points, "Y", "DOUBLE")
-        arcpy.AddField_management(temp_points, "ELEVATION", "DOUBLE")
-
-        # 添加点要素
-        with arcpy.da.InsertCursor(temp_points, ["SHAPE@", "PointID", "X", "Y"]) as cursor:
-            for i, (lon, lat) in enumerate(lon_lat_list):
-                point = arcpy.Point(lon, lat)
-                cursor.insertRow([point, i, lon, lat])
-
-        try:
-            # 为每个DEM准备单独的字段名
-            field_names = [f"ELEVATION_{i}" for i in range(len(self.dem_dict))]
-            in_rasters = [[dem_path, field_name] for dem_path, field_name in zip(self.dem_dict.keys(), field_names)]
-
-            # 使用ExtractMultiValuesToPoints一次性提取所有DEM的高程值
-            sa.ExtractMultiValuesToPoints(temp_points, in_rasters, "BILINEAR")
-
-            # 读取高程值
-            elevations = [0.0] * len(lon_lat_list)
-            with arcpy.da.SearchCursor(temp_points, ["PointID"] + field_names) as cursor:
-                for row in cursor:
-                    point_id = row[0]
-                    # 找到第一个非None的高程值
-                    elevation = next((e for e in row[1:] if e is not None), 0.0)
-                    elevations[point_id] = int(elevation) # 取整即可
-
-        except RuntimeError as e:
-            print(f"提取高程值时出错: {str(e)}")
-            elevations = [0.0] * len(lon_lat_list)
-
-        finally:
-            # 删除临时点要素类
-            arcpy.Delete_management(temp_points)
+
+    def _candidate_dems(self, min_lon, min_lat, max_lon, max_lat):
+        """
+        获取范围可能与给定包围盒相交的DEM路径（按配置顺序）
+
+        参数:
+            min_lon (float): 包围盒最小经度
+            min_lat (float): 包围盒最小纬度
+            max_lon (float): 包围盒最大经度
+            max_lat (float): 包围盒最大纬度
+
+        返回:
+            list: 候选DEM下标列表
+        """
+        # 单DEM部署直接返回，跳过所有索引开销
+        if self._extent_tree is None:
+            return range(len(self._dem_paths))
+        indices = self._extent_tree.query(box(min_lon, min_lat, max_lon, max_lat))
+        # 保持配置顺序，保证“第一个覆盖的DEM优先”的语义不变
+        return sorted(indices)
+
+    def _sample_dem(self, dem_index, lons, lats):
+        """
+        在单个DEM上批量双线性采样
+
+        一次性读出覆盖所有查询点的栅格窗口，然后在numpy里完成插值，
+        避免逐点的要素类与游标往返。
+
+        参数:
+            dem_index (int): DEM下标
+            lons (np.ndarray): 查询点经度数组（均落在该DEM范围内）
+            lats (np.ndarray): 查询点纬度数组
+
+        返回:
+            np.ndarray: 插值得到的高程数组，无数据处为0
+        """
+        min_lon, max_lon, min_lat, max_lat = self._bounds_arr[dem_index]
+        cell_width, cell_height = self._cell_sizes[dem_index]
+        total_cols = int(round((max_lon - min_lon) / cell_width))
+        total_rows = int(round((max_lat - min_lat) / cell_height))
+
+        # 覆盖所有查询点的紧致窗口，向外扩一个像元保证邻居可用
+        col_start = max(int((lons.min() - min_lon) / cell_width) - 1, 0)
+        col_stop = min(int((lons.max() - min_lon) / cell_width) + 2, total_cols)
+        row_start = max(int((lats.min() - min_lat) / cell_height) - 1, 0)
+        row_stop = min(int((lats.max() - min_lat) / cell_height) + 2, total_rows)
+
+        lower_left = arcpy.Point(min_lon + col_start * cell_width,
+                                 min_lat + row_start * cell_height)
+        block = arcpy.RasterToNumPyArray(
+            self._dem_rasters[dem_index], lower_left,
+            col_stop - col_start, row_stop - row_start,
+            nodata_to_value=np.nan).astype(np.float64)
+        nrows, ncols = block.shape
+
+        # 像元中心配准的分数行列号（行号自上而下）
+        block_max_lat = min_lat + row_stop * cell_height
+        frac_col = np.clip((lons - (min_lon + col_start * cell_width)) / cell_width - 0.5,
+                           0, ncols - 1)
+        frac_row = np.clip((block_max_lat - lats) / cell_height - 0.5,
+                           0, nrows - 1)
+
+        col0 = np.floor(frac_col).astype(np.int64)
+        row0 = np.floor(frac_row).astype(np.int64)
+        col1 = np.minimum(col0 + 1, ncols - 1)
+        row1 = np.minimum(row0 + 1, nrows - 1)
+        w_col = frac_col - col0
+        w_row = frac_row - row0
+
+        # 双线性插值：一次取出四个邻居并按权重混合
+        values = (block[row0, col0] * (1 - w_row) * (1 - w_col)
+                  + block[row0, col1] * (1 - w_row) * w_col
+                  + block[row1, col0] * w_row * (1 - w_col)
+                  + block[row1, col1] * w_row * w_col)
+        return np.where(np.isnan(values), 0.0, values)
+
+    def batch_get_elevation(self, lons, lats):
+        lons = np.asarray(lons, dtype=np.float64)
+        lats = np.asarray(lats, dtype=np.float64)
+        elevations = np.zeros(len(lons))
+        if len(lons) == 0 or not self._dem_paths:
+            return elevations
+
+        # 一次广播得到(K, N)的包含矩阵，argmax取每点第一个覆盖它的DEM
+        # （行序即配置顺序，保持“第一个覆盖的DEM优先”的语义）
+        contains = ((lons >= self._bounds_arr[:, 0, None])
+                    & (lons <= self._bounds_arr[:, 1, None])
+                    & (lats >= self._bounds_arr[:, 2, None])
+                    & (lats <= self._bounds_arr[:, 3, None]))
+        covered = contains.any(axis=0)
+        if not covered.any():
+            return elevations
+        dem_indices = contains.argmax(axis=0)
+
+        # 按DEM分组批量采样
+        for k in np.unique(dem_indices[covered]):
+            mask = covered & (dem_indices == k)
+            try:
+                values = self._sample_dem(k, lons[mask], lats[mask])
+            except RuntimeError as e:
+                print(f"提取高程值时出错: {str(e)}")
+                values = np.zeros(int(mask.sum()))
+            elevations[mask] = np.trunc(values) # 取整即可
         return elevations
 
     def get_elevation(self, lon, lat):
@@ -103,4 +167,4 @@ class ArcgisElevationProvider(ElevationProvider):
         返回:
             float: 高程值（米）
         """
-        return self.batch_get_elevation([(lon, lat)])[0]
+        return self.batch_get_elevation([lon], [lat])[0]
@@ -10,11 +10,42 @@ from .observers.trajectory_observer import TrajectoryObserver
 from .observers.console_trajectory_observer import ConsoleTrajectoryObserver
 # 移除 GPXTrajectoryObserver 的导入
 from .inspection_task import InspectionTask
+from concurrent.futures import ProcessPoolExecutor
 import time
+import numpy as np
+
+
+def _shoelace_area(xs: np.ndarray, ys: np.ndarray) -> float:
+    """
+    使用鞋带公式计算多边形面积，避免构建完整的几何对象
+
+    :param xs: 顶点X坐标一维数组
+    :param ys: 顶点Y坐标一维数组
+    :return: 多边形面积
+    """
+    return 0.5 * abs(np.dot(xs, np.roll(ys, -1)) - np.dot(ys, np.roll(xs, -1)))
+
 
 class TrajectorySimulator(GPSObserver):
     """轨迹模拟器类"""
 
+    # 事件名到观察者回调的分发表：(方法名, 参数来源)；
+    # 参数来源为None表示无参回调，为键名表示从data中取该键的值，
+    # 为"data"表示原样传入data
+    _EVENT_DISPATCH = {
+        "start_recording": ("on_start_recording", None),
+        "stop_recording": ("on_stop_recording", None),
+        "pause_recording": ("on_pause_recording", None),
+        "resume_recording": ("on_resume_recording", None),
+        "update": ("on_data_update", "data"),
+        "time_changed": ("on_time_changed", "new_time"),
+        "position_changed": ("on_position_changed", "new_position"),
+        "simulation_attempt": ("on_simulation_attempt", "data"),
+        "simulation_retry": ("on_simulation_retry", "data"),
+        "simulation_success": ("on_simulation_success", "data"),
+        "simulation_failure": ("on_simulation_failure", "data"),
+    }
+
     def __init__(self, config: Config):
         """
         初始化轨迹模拟器
@@ -46,36 +77,33 @@ class TrajectorySimulator(GPSObserver):
             # 开始记录GPS数据
             self.gps.start_recording()
 
-            # 主要模拟循环
+            # 主要模拟循环；步长固定，无需每tick读墙钟
+            elapsed_time = 1
             while not self.inspection_task.is_complete():
-                current_time = time.time()
-                elapsed_time = 1
-                self.last_update_time = current_time
-
                 # 获取下一个目标点
                 target = self.inspection_task.get_next_target()
-                # 移动人员到新位置
-                new_position = self.person.move(target, elapsed_time)
+                # 移动人员到新位置（全程标量坐标，不构造Point）
+                new_x, new_y = self.person.move_xy(target.x, target.y, elapsed_time)
 
                 # 更新GPS设备位置
-                offset = Point(new_position.x - self.gps.position.x, new_position.y - self.gps.position.y)
-                self.gps.update(elapsed_time, offset)
-                
+                self.gps.update(elapsed_time,
+                                new_x - self.gps.position_x,
+                                new_y - self.gps.position_y)
+
                 # 检查GPS显示的点是否在当前行进边上
-                gps_position = self.gps.get_data()[POSITION_KEY]
-                if self.inspection_task.is_on_current_edge(gps_position, self.tolerance):
+                if self.inspection_task.is_on_current_edge_xy(
+                        self.gps.position_x, self.gps.position_y, self.tolerance):
                     if not self.inspection_task.move_to_next_target():
                         break
             
             # 停止记录GPS数据
             self.gps.stop_recording()
-            # 获取完整轨迹
-            trajectory = self.gps.get_trajectory()
-            
-            # 检查轨迹是否有效
-            if self.is_valid_trajectory(trajectory, polygon):
+            self.last_update_time = time.time()
+
+            # 有效性检查直接走列式存储，只有返回时才物化字典记录
+            if self.is_valid_trajectory(self.gps.trajectory, polygon):
                 self.notify_observers("simulation_success", {"attempt": attempt + 1})
-                return trajectory
+                return self.gps.get_trajectory()
 
             self.notify_observers("simulation_retry", {"attempt": attempt + 1, "max_attempts": max_attempts})
 
@@ -98,29 +126,32 @@ class TrajectorySimulator(GPSObserver):
         self.inspection_task = InspectionTask(self.actual_polygon, self.config)
         self.tolerance = self.config.get(Config.TOLERANCE_KEY, 1.0)
 
-    def is_valid_trajectory(self, trajectory: List[Dict], polygon: Polygon) -> bool:
+    def is_valid_trajectory(self, trajectory, polygon: Polygon) -> bool:
         """
         检查轨迹是否有效
         
-        :param trajectory: 轨迹数据
+        :param trajectory: 轨迹数据（列式Trajectory对象或字典记录列表）
         :param polygon: 原始多边形
         :return: 轨迹是否有效
         """
         if len(trajectory) < 3:
             return False
-        # 从轨迹数据中提取坐标
-        coordinates = [(data[POSITION_KEY].x, data[POSITION_KEY].y) for data in trajectory]
-        
-        try:
-            trajectory_polygon = Polygon(coordinates)
-            original_area = polygon.area
-            trajectory_area = trajectory_polygon.area
-            
-            area_threshold = self.config.get(Config.TRAJECTORY_AREA_THRESHOLD_KEY, 0.9)
-            return trajectory_area / original_area >= area_threshold
-        except ValueError as e:
-            print(f"创建轨迹多边形时出错: {e}")
-            return False
+        if hasattr(trajectory, 'xs'):
+            # 列式存储：坐标列零拷贝切片，免去逐点属性访问
+            xs = trajectory.xs[:len(trajectory)]
+            ys = trajectory.ys[:len(trajectory)]
+        else:
+            # 字典记录列表：单次遍历提取全部坐标
+            coords = np.array([(data[POSITION_KEY].x, data[POSITION_KEY].y)
+                               for data in trajectory])
+            xs, ys = coords[:, 0], coords[:, 1]
+
+        # 直接用鞋带公式求面积，跳过轨迹多边形对象的构建
+        original_area = polygon.area
+        trajectory_area = _shoelace_area(xs, ys)
+
+        area_threshold = self.config.get(Config.TRAJECTORY_AREA_THRESHOLD_KEY, 0.9)
+        return trajectory_area / original_area >= area_threshold
 
     def _generate_terrain(self, polygon: Polygon) -> Polygon:
         """
@@ -149,29 +180,14 @@ class TrajectorySimulator(GPSObserver):
         self.observers.remove(observer)
 
     def notify_observers(self, event: str, data=None):
-        for observer in self.observers:
-            if event == "start_recording":
-                observer.on_start_recording()
-            elif event == "stop_recording":
-                observer.on_stop_recording()
-            elif event == "pause_recording":
-                observer.on_pause_recording()
-            elif event == "resume_recording":
-                observer.on_resume_recording()
-            elif event == "update":
-                observer.on_data_update(data)
-            elif event == "time_changed":
-                observer.on_time_changed(data["new_time"])
-            elif event == "position_changed":
-                observer.on_position_changed(data["new_position"])
-            elif event == "simulation_attempt":
-                observer.on_simulation_attempt(data)
-            elif event == "simulation_retry":
-                observer.on_simulation_retry(data)
-            elif event == "simulation_success":
-                observer.on_simulation_success(data)
-            elif event == "simulation_failure":
-                observer.on_simulation_failure(data)
+        method_name, arg_source = self._EVENT_DISPATCH[event]
+        if arg_source is None:
+            for observer in self.observers:
+                getattr(observer, method_name)()
+        else:
+            value = data if arg_source == "data" else data[arg_source]
+            for observer in self.observers:
+                getattr(observer, method_name)(value)
 
     def on_gps_update(self, data: Dict):
         """处理 GPS 更新事件"""
@@ -191,4 +207,38 @@ class TrajectorySimulator(GPSObserver):
 
     def on_gps_resume_recording(self):
         """处理 GPS 恢复记录事件"""
-        self.notify_observers("resume_recording")
\ No newline at end of file
+        self.notify_observers("resume_recording")
+
+def _simulate_polygon_worker(args):
+    """
+    进程池工作函数：在子进程中独立完成一个多边形的模拟
+
+    :param args: (配置JSON字符串, 起始时间, 起始位置坐标, 多边形顶点坐标)
+    :return: 模拟生成的轨迹
+    """
+    config_json, start_time, start_xy, polygon_coords = args
+    config = Config()
+    config.load(config_json)
+    simulator = TrajectorySimulator(config)
+    return simulator.simulate(start_time, Point(start_xy), Polygon(polygon_coords))
+
+
+def simulate_polygons_parallel(config: Config, polygons: List[Polygon],
+                               start_time: float, max_workers: int = None) -> List[List[Dict]]:
+    """
+    并行模拟多个多边形的轨迹
+
+    各多边形的模拟相互独立，使用进程池并行执行。每个工作进程根据配置
+    重建自己的模拟器，因此主进程上注册的观察者不会收到事件；
+    需要观察者输出时请使用 TrajectorySimulator.simulate 逐个模拟。
+
+    :param config: 配置对象
+    :param polygons: 模拟区域多边形列表
+    :param start_time: 每个模拟的起始时间
+    :param max_workers: 工作进程数，默认为CPU核心数
+    :return: 与输入多边形一一对应的轨迹列表
+    """
+    tasks = [(str(config), start_time, tuple(polygon.exterior.coords[0]),
+              list(polygon.exterior.coords)) for polygon in polygons]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_simulate_polygon_worker, tasks))